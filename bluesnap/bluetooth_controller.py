@@ -1,30 +1,47 @@
 """
 Bluetooth controller responsible for keeping a configured speaker paired,
-trusted, and connected. The controller polls every 10 seconds (configurable)
-to ensure the link remains healthy and reconnects automatically when the
-speaker comes back online.
+trusted, and connected. The device is driven through BlueZ over D-Bus when
+available (falling back to bluetoothctl), and a watchdog reconnects
+automatically when the speaker comes back online.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import re
+import uuid
 from collections.abc import Awaitable, Callable
 from contextlib import suppress
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from typing import Any
+
+from dbus_next import BusType, Variant
+from dbus_next.aio import MessageBus, ProxyInterface
+from dbus_next.errors import AuthError, DBusError, InterfaceNotFoundError
 
 from .config import BluetoothConfig, BluetoothSpeakerConfig
 from .utils import resolve_controller_identifier
 
 LOG = logging.getLogger(__name__)
 
+BLUEZ_SERVICE = "org.bluez"
+BLUEZ_ADAPTER_INTERFACE = "org.bluez.Adapter1"
+BLUEZ_DEVICE_INTERFACE = "org.bluez.Device1"
+DBUS_PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
+
+_CONNECTED_RE = re.compile(rb"(?mi)^\s*connected:\s*(yes|no)\b")
+
+# Bounds for the adaptive watchdog interval (seconds).
+WATCHDOG_MIN_INTERVAL = 5
+WATCHDOG_MAX_INTERVAL = 300
+
 
 class BluetoothCommandError(RuntimeError):
     """Raised when a bluetoothctl command fails."""
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ControllerCallbacks:
     """Optional hooks for other components to receive state updates."""
 
@@ -34,11 +51,17 @@ class ControllerCallbacks:
 
 class BluetoothController:
     """
-    Manage a bluetooth speaker connection using bluetoothctl commands.
+    Manage a bluetooth speaker connection through BlueZ.
+
+    Trust, connect, and link-state queries use the ``org.bluez.Device1`` D-Bus
+    interface directly; a persistent bluetoothctl session registers the pairing
+    agent and stands in for D-Bus when the system bus is unavailable.
 
     The controller attempts to keep the configured speaker connected, retrying
-    every ``reconnect_interval`` seconds when it is unavailable. A keepalive
-    loop periodically pings the device so that idle speakers do not go to sleep.
+    every ``reconnect_interval`` seconds when it is unavailable. Connection state
+    is cached from BlueZ ``PropertiesChanged`` signals so healthy watchdog ticks
+    cost nothing. A keepalive loop periodically pings the device so that idle
+    speakers do not go to sleep.
     """
 
     def __init__(
@@ -51,24 +74,56 @@ class BluetoothController:
         self._config = config
         self._speaker = config.speaker
         self._callbacks = callbacks or ControllerCallbacks()
-        self._loop = loop or asyncio.get_event_loop()
-        self._controller_id = resolve_controller_identifier(config.adapter)
+        # Resolved from the running loop in start() unless given explicitly.
+        self._loop = loop
+        # Adapter address, read from BlueZ in start() (hciconfig without D-Bus).
+        self._controller_id: str | None = None
 
         self._running = False
         self._tasks: set[asyncio.Task[None]] = set()
-        self._last_keepalive = datetime.min
-        self._last_connect_attempt = datetime.min
+        # Event loop (monotonic) timestamp; -inf means "never".
+        self._last_connect_attempt = float("-inf")
         self._connected = False
+        self._proc: asyncio.subprocess.Process | None = None
+        self._proc_lock = asyncio.Lock()
+        self._selected_controller: str | None = None
+        self._bus: MessageBus | None = None
+        self._device: ProxyInterface | None = None
+        self._device_props: ProxyInterface | None = None
+        self._link_lost = asyncio.Event()
 
     async def start(self) -> None:
         """Power on the adapter, trust the device, and begin watchdog loops."""
         if self._running:
             return
         self._running = True
+        self._loop = self._loop or asyncio.get_running_loop()
         LOG.info("starting bluetooth controller for '%s'", self._speaker.name)
-        await self._prepare_adapter()
-        await self._trust_device(self._speaker.mac)
-        await self._connect_if_needed()
+        try:
+            await self._subscribe_device_signals()
+            if self._controller_id is None:
+                self._controller_id = await asyncio.to_thread(
+                    resolve_controller_identifier, self._config.adapter
+                )
+            await self._prepare_adapter()
+            try:
+                await self._trust_device(self._speaker.mac)
+                await self._update_connected(await self._read_link_state())
+                await self._connect_if_needed()
+            except (BluetoothCommandError, TimeoutError, OSError) as exc:
+                # An unreachable speaker must not take the service down; the
+                # watchdog keeps retrying once it is running.
+                LOG.warning(
+                    "initial connect to '%s' failed, watchdog will retry: %s",
+                    self._speaker.name,
+                    exc,
+                )
+        except BaseException:
+            # Never stay marked as running without the loops that keep us connected.
+            self._running = False
+            self._unsubscribe_device_signals()
+            await self._close_proc()
+            raise
         self._spawn(self._watchdog_loop(), "bt-watchdog")
         self._spawn(self._keepalive_loop(), "bt-keepalive")
 
@@ -83,6 +138,8 @@ class BluetoothController:
             with suppress(asyncio.CancelledError):
                 await task
         self._tasks.clear()
+        self._unsubscribe_device_signals()
+        await self._close_proc()
 
     @property
     def active_speaker(self) -> BluetoothSpeakerConfig:
@@ -93,36 +150,52 @@ class BluetoothController:
         return self._connected
 
     async def _watchdog_loop(self) -> None:
-        """Check connection status and reconnect when necessary."""
-        interval = max(5, self._config.reconnect_interval)
+        """
+        Check connection status and reconnect when necessary.
+
+        While BlueZ signals report link drops, the interval doubles after every
+        healthy check (up to ``WATCHDOG_MAX_INTERVAL``). Without them (the
+        bluetoothctl fallback) polling is the only way to notice a drop, so it
+        stays at the configured reconnect interval. Either way it drops back to
+        ``WATCHDOG_MIN_INTERVAL`` as soon as the link is lost or a check fails.
+        """
+        base_interval = min(
+            max(WATCHDOG_MIN_INTERVAL, self._config.reconnect_interval), WATCHDOG_MAX_INTERVAL
+        )
+        interval = base_interval
         while self._running:
+            self._link_lost.clear()
             try:
                 await self._connect_if_needed()
             except (BluetoothCommandError, TimeoutError, OSError) as exc:
                 LOG.warning("bluetooth watchdog loop error: %s", exc)
-            await asyncio.sleep(interval)
+                interval = WATCHDOG_MIN_INTERVAL
+            else:
+                if self._connected and self._device_props is not None:
+                    interval = min(interval * 2, WATCHDOG_MAX_INTERVAL)
+                elif self._connected:
+                    interval = base_interval
+                else:
+                    interval = WATCHDOG_MIN_INTERVAL
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._link_lost.wait(), timeout=interval)
+            if self._link_lost.is_set():
+                interval = WATCHDOG_MIN_INTERVAL
 
     async def _keepalive_loop(self) -> None:
         """Issue a harmless command periodically so the speaker stays awake."""
         interval = max(5, self._speaker.keepalive_interval)
         while self._running:
-            now = datetime.utcnow()
-            if now - self._last_keepalive >= timedelta(seconds=interval):
-                try:
-                    await self._run_btctl(
-                        ["select", self._config.adapter],
-                        ["info", self._speaker.mac],
-                    )
-                    LOG.debug("sent keepalive to '%s'", self._speaker.name)
-                except BluetoothCommandError as exc:
-                    LOG.debug("keepalive failed for '%s': %s", self._speaker.name, exc)
-                self._last_keepalive = now
-            await asyncio.sleep(1)
+            try:
+                await self._run_btctl(["info", self._speaker.mac])
+                LOG.debug("sent keepalive to '%s'", self._speaker.name)
+            except BluetoothCommandError as exc:
+                LOG.debug("keepalive failed for '%s': %s", self._speaker.name, exc)
+            await asyncio.sleep(interval)
 
     async def _prepare_adapter(self) -> None:
-        """Select the adapter and ensure it is powered on and discoverable."""
+        """Ensure the (already selected) adapter is powered on and discoverable."""
         await self._run_btctl(
-            ["select", self._controller_id],
             ["power", "on"],
             ["pairable", "on"],
             ["agent", "on"],
@@ -131,47 +204,174 @@ class BluetoothController:
 
     async def _trust_device(self, mac: str) -> None:
         """Mark the speaker as trusted so the OS reconnects automatically."""
-        await self._run_btctl(
-            ["select", self._controller_id],
-            ["trust", mac],
-        )
+        if self._device is None:
+            await self._run_btctl(["trust", mac])
+            return
+        try:
+            await self._device.set_trusted(True)
+        except DBusError as exc:
+            raise BluetoothCommandError(f"trust {mac} failed: {exc}") from exc
 
     async def _connect_if_needed(self) -> None:
         """Connect the speaker when disconnected or when we have not tried recently."""
         connected = await self._is_connected()
         if connected:
             return
-        now = datetime.utcnow()
-        if now - self._last_connect_attempt < timedelta(seconds=self._config.reconnect_interval):
+        now = self._loop.time()
+        if now - self._last_connect_attempt < self._config.reconnect_interval:
             return
         self._last_connect_attempt = now
         LOG.info("connecting bluetooth speaker '%s'", self._speaker.name)
-        await self._run_btctl(
-            ["select", self._controller_id],
-            ["connect", self._speaker.mac],
-        )
-        self._connected = True
-        if self._callbacks.on_connected:
-            await self._callbacks.on_connected(self._speaker)
+        if self._device is not None:
+            try:
+                await self._device.call_connect()
+            except DBusError as exc:
+                raise BluetoothCommandError(f"connect {self._speaker.mac} failed: {exc}") from exc
+            return
+        await self._run_btctl(["connect", self._speaker.mac])
+        if self._device_props is None:
+            # Without D-Bus signals nothing else will report the new state.
+            await self._update_connected(True)
 
     async def _is_connected(self) -> bool:
-        """Return True when bluetoothctl reports the device is connected."""
-        output = await self._run_btctl(
-            ["select", self._controller_id],
-            ["info", self._speaker.mac],
-        )
-        for line in output.splitlines():
-            if line.strip().lower().startswith("connected:"):
-                result = line.strip().split(":")[1].strip().lower() == "yes"
-                self._connected = result
-                return result
-        if self._callbacks.on_disconnected:
-            await self._callbacks.on_disconnected(self._speaker)
-        self._connected = False
-        return False
+        """Return the cached link state, polling bluetoothctl only without D-Bus signals."""
+        if self._device_props is not None:
+            return self._connected
+        connected = await self._query_connected()
+        await self._update_connected(connected)
+        return connected
+
+    async def _read_link_state(self) -> bool:
+        """Read the current ``Connected`` property, via D-Bus when subscribed."""
+        if self._device is None:
+            return await self._query_connected()
+        try:
+            return bool(await self._device.get_connected())
+        except DBusError as exc:
+            raise BluetoothCommandError(f"reading link state failed: {exc}") from exc
+
+    async def _query_connected(self, timeout: int = 30) -> bool:
+        """
+        Return True when bluetoothctl reports the device is connected.
+
+        Answers as soon as the ``Connected:`` line arrives; the rest of the
+        ``info`` output is drained in the background before the process is
+        handed to the next caller.
+        """
+        await self._proc_lock.acquire()
+        handed_off = False
+        try:
+            try:
+                proc = await self._ensure_proc()
+                marker = await self._send_btctl(proc, ["info", self._speaker.mac])
+                connected, done = await asyncio.wait_for(
+                    self._read_connected(proc, marker), timeout=timeout
+                )
+            except (TimeoutError, ConnectionError, BluetoothCommandError):
+                await self._close_proc()
+                raise
+            if not done:
+                # The drain task owns the lock now; a done callback releases it even if
+                # the task is cancelled before it ever runs.
+                task = self._spawn(self._drain_proc(proc, marker, timeout), "bt-drain")
+                task.add_done_callback(lambda _task: self._proc_lock.release())
+                handed_off = True
+            return connected
+        finally:
+            if not handed_off:
+                self._proc_lock.release()
+
+    @staticmethod
+    async def _read_connected(proc: asyncio.subprocess.Process, marker: bytes) -> tuple[bool, bool]:
+        """Return ``(connected, marker_seen)`` from the first decisive output line."""
+        assert proc.stdout
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                raise BluetoothCommandError("bluetoothctl exited unexpectedly")
+            if marker in line:
+                return False, True
+            match = _CONNECTED_RE.search(line)
+            if match:
+                return match.group(1).lower() == b"yes", False
+
+    async def _drain_proc(
+        self, proc: asyncio.subprocess.Process, marker: bytes, timeout: int
+    ) -> None:
+        try:
+            await asyncio.wait_for(self._read_until_marker(proc, marker), timeout=timeout)
+        except (TimeoutError, ConnectionError, BluetoothCommandError):
+            await self._close_proc()
+
+    async def _update_connected(self, connected: bool) -> None:
+        """Record the link state and fire callbacks on connect/disconnect edges."""
+        if connected == self._connected:
+            return
+        self._connected = connected
+        if connected:
+            LOG.info("bluetooth speaker '%s' connected", self._speaker.name)
+            if self._callbacks.on_connected:
+                await self._callbacks.on_connected(self._speaker)
+        else:
+            LOG.info("bluetooth speaker '%s' disconnected", self._speaker.name)
+            self._link_lost.set()
+            if self._callbacks.on_disconnected:
+                await self._callbacks.on_disconnected(self._speaker)
+
+    async def _subscribe_device_signals(self) -> None:
+        """Listen for BlueZ property changes on the speaker instead of polling."""
+        adapter_path = f"/org/bluez/{self._config.adapter}"
+        path = f"{adapter_path}/dev_{self._speaker.mac.replace(':', '_')}"
+        try:
+            self._bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+            self._controller_id = await self._read_adapter_address(adapter_path)
+            introspection = await self._bus.introspect(BLUEZ_SERVICE, path)
+            proxy = self._bus.get_proxy_object(BLUEZ_SERVICE, path, introspection)
+            self._device = proxy.get_interface(BLUEZ_DEVICE_INTERFACE)
+            self._device_props = proxy.get_interface(DBUS_PROPERTIES_INTERFACE)
+        except (AuthError, DBusError, InterfaceNotFoundError, OSError) as exc:
+            LOG.warning(
+                "bluetooth D-Bus interface unavailable for '%s'; using bluetoothctl: %s",
+                self._speaker.name,
+                exc,
+            )
+            self._unsubscribe_device_signals()
+            return
+        self._device_props.on_properties_changed(self._on_properties_changed)
+        LOG.debug("subscribed to bluez property changes on %s", path)
+
+    async def _read_adapter_address(self, path: str) -> str:
+        """Return the adapter's address from ``org.bluez.Adapter1`` on the open bus."""
+        assert self._bus
+        introspection = await self._bus.introspect(BLUEZ_SERVICE, path)
+        proxy = self._bus.get_proxy_object(BLUEZ_SERVICE, path, introspection)
+        props = proxy.get_interface(DBUS_PROPERTIES_INTERFACE)
+        address = await props.call_get(BLUEZ_ADAPTER_INTERFACE, "Address")
+        return str(address.value).upper()
+
+    def _unsubscribe_device_signals(self) -> None:
+        if self._device_props is not None:
+            self._device_props.off_properties_changed(self._on_properties_changed)
+            self._device_props = None
+        self._device = None
+        if self._bus is not None:
+            self._bus.disconnect()
+            self._bus = None
+
+    def _on_properties_changed(
+        self,
+        interface: str,
+        changed: dict[str, Variant],
+        invalidated: list[Any],
+    ) -> None:
+        if interface != BLUEZ_DEVICE_INTERFACE or "Connected" not in changed:
+            return
+        self._spawn(self._update_connected(bool(changed["Connected"].value)), "bt-state")
 
-    def _spawn(self, coro: Awaitable[None], name: str) -> None:
+    def _spawn(self, coro: Awaitable[None], name: str) -> asyncio.Task[None]:
         task = self._loop.create_task(coro, name=name)
+        # The event loop only holds weak references to tasks, so this set must stay
+        # strong while they run; _cleanup drops each task as soon as it finishes.
         self._tasks.add(task)
 
         def _cleanup(task: asyncio.Task[None]) -> None:
@@ -180,31 +380,101 @@ class BluetoothController:
                 task.result()
 
         task.add_done_callback(_cleanup)
+        return task
 
-    async def _run_btctl(self, *command_groups: list[str], timeout: int = 30) -> str:
+    async def _ensure_proc(self) -> asyncio.subprocess.Process:
         """
-        Run bluetoothctl with provided commands and return stdout.
+        Return the long-lived bluetoothctl process, spawning it when needed.
+
+        The controller is selected once per process (and again only if the
+        controller id changes), so callers never prefix their commands with
+        ``select``.
+        """
+        if self._proc is None or self._proc.returncode is not None:
+            LOG.debug("spawning persistent bluetoothctl for '%s'", self._config.adapter)
+            self._proc = await asyncio.create_subprocess_exec(
+                "bluetoothctl",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
+            self._selected_controller = None
+        if self._selected_controller != self._controller_id:
+            assert self._proc.stdin
+            self._proc.stdin.write(f"select {self._controller_id}\n".encode())
+            self._selected_controller = self._controller_id
+        return self._proc
+
+    async def _close_proc(self) -> None:
+        """Ask the persistent bluetoothctl process to quit, killing it if it lingers."""
+        proc, self._proc = self._proc, None
+        if proc is None or proc.returncode is not None:
+            return
+        assert proc.stdin
+        with suppress(ConnectionError):
+            proc.stdin.write(b"quit\n")
+            await proc.stdin.drain()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+
+    async def _run_btctl(self, *command_groups: list[str], timeout: int = 30) -> bytes:
+        """
+        Send commands to the persistent bluetoothctl process and return its raw output.
 
         Each element in ``command_groups`` represents a command followed by
-        its arguments, e.g. ``["connect", "AA:BB:CC:DD:EE:FF"]``.
+        its arguments, e.g. ``["connect", "AA:BB:CC:DD:EE:FF"]``. The batch is
+        terminated by a unique marker sent as a command of its own; output is
+        collected until the marker comes back.
         """
 
-        proc = await asyncio.create_subprocess_exec(
-            "bluetoothctl",
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        async with self._proc_lock:
+            proc = await self._ensure_proc()
+            try:
+                marker = await self._send_btctl(proc, *command_groups)
+                return await asyncio.wait_for(
+                    self._read_until_marker(proc, marker), timeout=timeout
+                )
+            except (TimeoutError, ConnectionError, BluetoothCommandError):
+                # The stream position is unknown now; start over with a fresh process.
+                await self._close_proc()
+                raise
+
+    @staticmethod
+    async def _send_btctl(proc: asyncio.subprocess.Process, *command_groups: list[str]) -> bytes:
+        """
+        Write a command batch followed by a unique marker; return the marker.
+
+        The marker is sent as a bare (unknown) command rather than through the
+        shell's ``echo`` builtin, which older BlueZ releases (e.g. 5.55 in
+        Debian bullseye) lack. Every bluetoothctl names an unknown command in
+        its ``Invalid command in menu main: ...`` reply, and interactive builds
+        also echo the line back, so the marker shows up once all earlier
+        commands in the batch have been processed.
+        """
         assert proc.stdin
-        for group in command_groups:
-            cmd = " ".join(group)
-            LOG.debug("btctl <<< %s", cmd)
-            proc.stdin.write(cmd.encode("utf-8") + b"\n")
-        proc.stdin.write(b"quit\n")
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
-        if proc.returncode != 0:
-            raise BluetoothCommandError(stderr.decode().strip())
-        return stdout.decode()
+        marker = f"__BTCTL_DONE_{uuid.uuid4().hex}__".encode()
+        lines = [" ".join(group) for group in command_groups]
+        LOG.debug("btctl <<< %s", "; ".join(lines))
+        lines.append(marker.decode())
+        # One write: the pipe transport issues a write() syscall per call when idle.
+        proc.stdin.write("\n".join(lines).encode("utf-8") + b"\n")
+        await proc.stdin.drain()
+        return marker
+
+    @staticmethod
+    async def _read_until_marker(proc: asyncio.subprocess.Process, marker: bytes) -> bytes:
+        assert proc.stdout
+        lines: list[bytes] = []
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                raise BluetoothCommandError("bluetoothctl exited unexpectedly")
+            if marker in line:
+                return b"".join(lines)
+            lines.append(line)
 
 
 __all__ = ["BluetoothController", "ControllerCallbacks", "BluetoothCommandError"]
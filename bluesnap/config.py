@@ -8,14 +8,28 @@ derived from the configured identity wherever possible.
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Literal
 
 import yaml
-from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
 
+try:  # prefer the libyaml C bindings when PyYAML was built with them
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-class IdentityConfig(BaseModel):
+_MAC_RE = re.compile(r"^[0-9A-F]{2}(?::[0-9A-F]{2}){5}$")
+
+
+class _ConfigModel(BaseModel):
+    """Base for all config sections: immutable once loaded."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class IdentityConfig(_ConfigModel):
     """Metadata describing this bridge instance."""
 
     instance_name: str = Field(
@@ -29,7 +43,7 @@ class IdentityConfig(BaseModel):
     )
 
 
-class MQTTTLSConfig(BaseModel):
+class MQTTTLSConfig(_ConfigModel):
     enabled: bool = False
     ca_cert: Path | None = None
     client_cert: Path | None = None
@@ -53,7 +67,7 @@ class MQTTTLSConfig(BaseModel):
         return self
 
 
-class MQTTConfig(BaseModel):
+class MQTTConfig(_ConfigModel):
     host: str
     port: int = 1883
     username: str | None = None
@@ -74,7 +88,7 @@ class MQTTConfig(BaseModel):
         return self.client_id or f"bluesnap-{identity.unique_suffix}"
 
 
-class BluetoothSpeakerConfig(BaseModel):
+class BluetoothSpeakerConfig(_ConfigModel):
     name: str
     mac: str
     keepalive_interval: int = 30
@@ -83,18 +97,18 @@ class BluetoothSpeakerConfig(BaseModel):
     @classmethod
     def normalize_mac(cls, value: str) -> str:
         cleaned = value.strip().upper()
-        if len(cleaned.split(":")) != 6:
+        if not _MAC_RE.fullmatch(cleaned):
             raise ValueError("Speaker MAC must be in AA:BB:CC:DD:EE:FF format")
         return cleaned
 
 
-class BluetoothConfig(BaseModel):
+class BluetoothConfig(_ConfigModel):
     adapter: str = "hci0"
     speaker: BluetoothSpeakerConfig
     reconnect_interval: int = 10
 
 
-class SnapcastConfig(BaseModel):
+class SnapcastConfig(_ConfigModel):
     server_host: str
     server_stream: str | None = None
     server_port: int = 1704
@@ -109,7 +123,7 @@ class SnapcastConfig(BaseModel):
         return self.client_name or identity.instance_name
 
 
-class LoggingSyslogConfig(BaseModel):
+class LoggingSyslogConfig(_ConfigModel):
     enabled: bool = False
     host: str | None = None
     port: int = 6514
@@ -123,25 +137,32 @@ class LoggingSyslogConfig(BaseModel):
         return self
 
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(_ConfigModel):
     level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
     syslog: LoggingSyslogConfig = LoggingSyslogConfig()
 
 
-class TelemetryConfig(BaseModel):
+class TelemetryConfig(_ConfigModel):
     interval: int = 15
+    qos: Literal[0, 1, 2] = Field(
+        0,
+        description=(
+            "MQTT QoS for telemetry. 0 skips the PUBACK round trip; a lost sample is "
+            "replaced by the next one"
+        ),
+    )
     metrics: list[Literal["cpu", "memory", "load", "temperature", "bluetooth"]] = Field(
         default_factory=lambda: ["cpu", "memory", "load", "temperature"]
     )
 
 
-class WatchdogConfig(BaseModel):
+class WatchdogConfig(_ConfigModel):
     watchdog_interval: int = 60
     max_retries: int = 3
     reboot_on_failure: bool = True
 
 
-class BluesnapConfig(BaseModel):
+class BluesnapConfig(_ConfigModel):
     identity: IdentityConfig
     mqtt: MQTTConfig
     bluetooth: BluetoothConfig
@@ -158,8 +179,9 @@ class BluesnapConfig(BaseModel):
         _ = self.snapcast.resolved_client_name(self.identity)
         return self
 
+    @property
     def effective_topics(self) -> dict[str, str]:
-        """Return commonly used MQTT topic prefixes."""
+        """Commonly used MQTT topic prefixes."""
         base_topic = self.mqtt.resolved_base_topic(self.identity)
         discovery = self.mqtt.discovery_prefix.rstrip("/")
         device_id = self.identity.instance_name.replace(" ", "_")
@@ -182,7 +204,7 @@ def load_config(path: str | Path) -> BluesnapConfig:
     config_path = Path(path)
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    data = yaml.safe_load(config_path.read_text()) or {}
+    data = yaml.load(config_path.read_bytes(), Loader=_YamlLoader) or {}
     try:
         return BluesnapConfig.model_validate(data)
     except ValidationError as exc:
@@ -1,17 +1,26 @@
 """
 MQTT v5 bridge responsible for announcing Home Assistant discovery payloads,
 publishing telemetry, and listening for control commands (volume, reconnect).
+
+The paho client is driven directly from the asyncio event loop (socket
+reader/writer callbacks plus a housekeeping task) instead of paho's network
+thread, so MQTT callbacks already run on the loop. Only the blocking TCP
+connect runs on a worker thread; socket registration is handed back to the loop.
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from collections.abc import Callable
+import socket
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
+import orjson
 import paho.mqtt.client as mqtt
 
 from .bluetooth_controller import BluetoothController
@@ -20,6 +29,16 @@ from .snapcast_bridge import SnapcastManager
 
 LOG = logging.getLogger(__name__)
 
+# Bounds for the delay between broker reconnect attempts (seconds).
+RECONNECT_MIN_DELAY = 1
+RECONNECT_MAX_DELAY = 60
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Pre-encoded availability payloads (retained on the status topic).
+AVAILABILITY_ONLINE = b"online"
+AVAILABILITY_OFFLINE = b"offline"
+
 
 class MQTTBridgeError(RuntimeError):
     """Raised when the bridge encounters repeated MQTT errors."""
@@ -28,7 +47,7 @@ class MQTTBridgeError(RuntimeError):
 ControlHandler = Callable[[dict[str, Any]], asyncio.Future | asyncio.Task | None]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MQTTTopics:
     discovery_prefix: str
     availability: str
@@ -37,12 +56,26 @@ class MQTTTopics:
     commands_reconnect: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MQTTBridge:
     config: BluesnapConfig
     bluetooth: BluetoothController
     snapcast: SnapcastManager
-    loop: asyncio.AbstractEventLoop = field(default_factory=asyncio.get_event_loop)
+    loop: asyncio.AbstractEventLoop | None = None
+
+    # Runtime state populated in __post_init__ (declared so the slots exist).
+    _client: mqtt.Client = field(init=False, repr=False)
+    _topics: MQTTTopics = field(init=False, repr=False)
+    _discovery_payloads: list[tuple[str, bytes]] = field(init=False, repr=False)
+    _connected_event: asyncio.Event = field(init=False, repr=False)
+    _running: bool = field(init=False, repr=False)
+    _tasks: set[asyncio.Task[None]] = field(init=False, repr=False)
+    _inbox: deque[tuple[str, bytes]] = field(init=False, repr=False)
+    _inbox_event: asyncio.Event = field(init=False, repr=False)
+    _telemetry_pending: bytes | None = field(init=False, repr=False)
+    _telemetry_ready: asyncio.Event = field(init=False, repr=False)
+    _telemetry_acked: asyncio.Event = field(init=False, repr=False)
+    _telemetry_mid: int | None = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._client = mqtt.Client(
@@ -50,10 +83,17 @@ class MQTTBridge:
             protocol=mqtt.MQTTv5,
             callback_api_version=mqtt.CallbackAPIVersion.VERSION2,
         )
-        self._client.enable_logger(LOG)
+        if LOG.isEnabledFor(logging.DEBUG):
+            # paho logs every packet it sends or receives; only route that when debugging.
+            self._client.enable_logger(LOG)
         self._client.on_connect = self._on_connect
         self._client.on_message = self._on_message
         self._client.on_disconnect = self._on_disconnect
+        self._client.on_publish = self._on_publish
+        self._client.on_socket_open = self._on_socket_open
+        self._client.on_socket_close = self._on_socket_close
+        self._client.on_socket_register_write = self._on_socket_register_write
+        self._client.on_socket_unregister_write = self._on_socket_unregister_write
         self._client.username_pw_set(self.config.mqtt.username, self.config.mqtt.password)
         if self.config.mqtt.tls.enabled:
             self._client.tls_set(
@@ -62,7 +102,7 @@ class MQTTBridge:
                 keyfile=str(self.config.mqtt.tls.client_key),
             )
 
-        topics = self.config.effective_topics()
+        topics = self.config.effective_topics
         self._topics = MQTTTopics(
             discovery_prefix=self.config.mqtt.discovery_prefix.rstrip("/"),
             availability=f"{topics['base']}/status",
@@ -70,23 +110,103 @@ class MQTTBridge:
             commands_volume=f"{topics['base']}/command/volume",
             commands_reconnect=f"{topics['base']}/command/reconnect",
         )
+        self._discovery_payloads = self._build_discovery_payloads()
         self._connected_event = asyncio.Event()
+        self._running = False
+        self._tasks = set()
+        self._inbox = deque()
+        self._inbox_event = asyncio.Event()
+        self._telemetry_pending = None
+        self._telemetry_ready = asyncio.Event()
+        self._telemetry_acked = asyncio.Event()
+        self._telemetry_mid = None
 
     async def start(self) -> None:
         LOG.info("connecting to MQTT broker %s:%s", self.config.mqtt.host, self.config.mqtt.port)
-        self._client.connect(
+        self._running = True
+        self.loop = self.loop or asyncio.get_running_loop()
+        # The TCP connect (DNS, TLS handshake) blocks, so it runs on a worker thread.
+        await asyncio.to_thread(
+            self._client.connect,
             self.config.mqtt.host,
             self.config.mqtt.port,
             keepalive=self.config.mqtt.keepalive,
         )
-        self._client.loop_start()
+        for coro, name in (
+            (self._misc_loop(), "mqtt-misc"),
+            (self._command_consumer(), "mqtt-commands"),
+            (self._telemetry_writer(), "mqtt-telemetry"),
+        ):
+            task = self.loop.create_task(coro, name=name)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
         await self._connected_event.wait()
         await self._publish_discovery()
-        await self._publish_availability("online")
+        await self._publish_availability(AVAILABILITY_ONLINE)
 
     async def stop(self) -> None:
-        self._client.loop_stop()
+        self._running = False
+        for task in list(self._tasks):
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await self._publish_availability(AVAILABILITY_OFFLINE)
         self._client.disconnect()
+        # Flush the status and DISCONNECT packets; the socket closes once they are written.
+        self._client.loop_write()
+
+    async def _misc_loop(self) -> None:
+        """Drive paho keepalives and reconnect after the broker connection drops."""
+        delay = RECONNECT_MIN_DELAY
+        while self._running:
+            rc = self._client.loop_misc()
+            if rc == mqtt.MQTT_ERR_NO_CONN:
+                self._connected_event.clear()
+                try:
+                    LOG.info("reconnecting to mqtt broker")
+                    await asyncio.to_thread(self._client.reconnect)
+                    delay = RECONNECT_MIN_DELAY
+                except OSError as exc:
+                    LOG.warning("mqtt reconnect failed, retrying in %ss: %s", delay, exc)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, RECONNECT_MAX_DELAY)
+                    continue
+            await asyncio.sleep(1)
+
+    def _call_on_loop(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Run ``callback`` on the event loop; paho fires socket callbacks from connect threads."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            callback(*args)
+        else:
+            self.loop.call_soon_threadsafe(callback, *args)
+
+    def _on_socket_open(self, client: mqtt.Client, userdata: Any, sock: socket.socket) -> None:
+        self._tune_socket(sock)
+        self._call_on_loop(self.loop.add_reader, sock, self._read_socket, client, sock)
+
+    @staticmethod
+    def _read_socket(client: mqtt.Client, sock: socket.socket) -> None:
+        """Read until the socket is drained; TLS may buffer records the selector never sees."""
+        pending = getattr(sock, "pending", lambda: 0)
+        while client.loop_read() == mqtt.MQTT_ERR_SUCCESS and pending():
+            pass
+
+    def _on_socket_close(self, client: mqtt.Client, userdata: Any, sock: socket.socket) -> None:
+        self._call_on_loop(self.loop.remove_reader, sock)
+
+    def _on_socket_register_write(
+        self, client: mqtt.Client, userdata: Any, sock: socket.socket
+    ) -> None:
+        self._call_on_loop(self.loop.add_writer, sock, client.loop_write)
+
+    def _on_socket_unregister_write(
+        self, client: mqtt.Client, userdata: Any, sock: socket.socket
+    ) -> None:
+        self._call_on_loop(self.loop.remove_writer, sock)
 
     def _on_connect(
         self,
@@ -106,7 +226,10 @@ class MQTTBridge:
                 (self._topics.commands_reconnect, 1),
             ]
         )
-        self.loop.call_soon_threadsafe(self._connected_event.set)
+        self._connected_event.set()
+        if self._telemetry_pending is not None:
+            # Send the snapshot held back while the broker was unreachable.
+            self._telemetry_ready.set()
 
     def _on_disconnect(
         self,
@@ -117,18 +240,36 @@ class MQTTBridge:
         properties: mqtt.Properties | None,
     ) -> None:  # noqa: D401,E501
         LOG.warning("mqtt disconnected: %s", mqtt.error_string(reason_code))
+        self._connected_event.clear()
+        # An in-flight QoS 0 packet dropped with the socket never fires on_publish.
+        self._telemetry_acked.set()
 
     def _on_message(self, client: mqtt.Client, userdata: Any, msg: mqtt.MQTTMessage) -> None:
-        payload = msg.payload.decode("utf-8")
-        LOG.debug("mqtt message %s => %s", msg.topic, payload)
-        asyncio.run_coroutine_threadsafe(self._handle_command(msg.topic, payload), self.loop)
+        self._inbox.append((msg.topic, msg.payload))
+        self._inbox_event.set()
+
+    async def _command_consumer(self) -> None:
+        """Dispatch queued commands; one wakeup drains every message that arrived meanwhile."""
+        while self._running:
+            await self._inbox_event.wait()
+            self._inbox_event.clear()
+            while self._inbox:
+                topic, payload = self._inbox.popleft()
+                if LOG.isEnabledFor(logging.DEBUG):
+                    LOG.debug("mqtt message %s => %s", topic, payload.decode("utf-8", "replace"))
+                try:
+                    await self._handle_command(topic, payload)
+                except asyncio.CancelledError:  # pragma: no cover - cooperative shutdown
+                    raise
+                except Exception as exc:  # noqa: BLE001
+                    LOG.warning("mqtt command on %s failed: %s", topic, exc)
 
-    async def _handle_command(self, topic: str, payload: str) -> None:
+    async def _handle_command(self, topic: str, payload: bytes) -> None:
         if topic == self._topics.commands_volume:
             try:
                 volume = int(payload)
             except ValueError:
-                LOG.warning("invalid volume payload %s", payload)
+                LOG.warning("invalid volume payload %r", payload)
                 return
             await self.snapcast.set_volume(volume)
         elif topic == self._topics.commands_reconnect:
@@ -138,34 +279,98 @@ class MQTTBridge:
             LOG.debug("no handler for topic %s", topic)
 
     async def publish_telemetry(self, data: dict[str, Any]) -> None:
-        payload = json.dumps(data)
-        LOG.debug("publishing telemetry: %s", payload)
-        result = self._client.publish(self._topics.telemetry, payload, qos=1, retain=False)
-        if result.rc != mqtt.MQTT_ERR_SUCCESS:
-            LOG.warning("telemetry publish failed: %s", result.rc)
+        """
+        Queue a telemetry snapshot for publishing.
+
+        Only the newest snapshot is kept: if the previous one is still in flight
+        (unacknowledged at QoS 1+, unwritten at QoS 0), this one replaces any
+        snapshot queued behind it, so a stalled broker cannot make the backlog grow.
+        The snapshot is serialized here, so callers may reuse ``data`` afterwards.
+        """
+        if self._telemetry_pending is not None:
+            LOG.debug("dropping stale telemetry snapshot")
+        self._telemetry_pending = orjson.dumps(data)
+        self._telemetry_ready.set()
+
+    async def _telemetry_writer(self) -> None:
+        """
+        Publish queued telemetry with at most one snapshot in flight.
+
+        While the broker is disconnected the newest snapshot stays in
+        ``_telemetry_pending`` (paho would otherwise queue every QoS 1+ publish
+        for replay); ``_on_connect`` wakes the writer to send it.
+        """
+        while self._running:
+            await self._telemetry_ready.wait()
+            self._telemetry_ready.clear()
+            if self._telemetry_pending is None or not self._client.is_connected():
+                continue
+            data, self._telemetry_pending = self._telemetry_pending, None
+            LOG.debug("publishing telemetry: %s", data)
+            self._telemetry_acked.clear()
+            result = self._client.publish(
+                self._topics.telemetry,
+                data,
+                qos=self.config.telemetry.qos,
+                retain=False,
+            )
+            if result.rc != mqtt.MQTT_ERR_SUCCESS:
+                LOG.warning("telemetry publish failed: %s", result.rc)
+                continue
+            self._telemetry_mid = result.mid
+            if not result.is_published():
+                try:
+                    await asyncio.wait_for(
+                        self._telemetry_acked.wait(), timeout=self.config.mqtt.keepalive
+                    )
+                except TimeoutError:
+                    LOG.warning("telemetry publish %s not acknowledged", result.mid)
+            self._telemetry_mid = None
+
+    def _on_publish(
+        self,
+        client: mqtt.Client,
+        userdata: Any,
+        mid: int,
+        reason_code: mqtt.ReasonCode,
+        properties: mqtt.Properties,
+    ) -> None:
+        if mid == self._telemetry_mid:
+            self._telemetry_acked.set()
 
     async def _publish_discovery(self) -> None:
+        with self._corked():
+            for topic, blob in self._discovery_payloads:
+                self._client.publish(topic, blob, retain=True, qos=1)
+            # Flush the whole burst while corked so PUBLISH frames share TCP segments.
+            self._client.loop_write()
+
+    def _build_discovery_payloads(self) -> list[tuple[str, bytes]]:
+        """Serialize every Home Assistant discovery config once; they never change."""
         device_info = self._device_payload()
         friendly = self.config.identity.friendly_name
         entities: list[tuple[str, str, dict[str, Any]]] = []
+        availability = [{"topic": self._topics.availability}]
+        common: dict[str, Any] = {
+            "device": device_info,
+            "availability": availability,
+            "state_topic": self._topics.telemetry,
+            "entity_category": "diagnostic",
+        }
 
         def sensor(
             object_id: str,
             name: str,
             template: str,
             *,
-            extra: dict[str, Any] | None = None,
+            extra: Mapping[str, Any] = _EMPTY,
         ) -> None:
             payload: dict[str, Any] = {
+                **common,
                 "name": f"{friendly} {name}",
-                "state_topic": self._topics.telemetry,
                 "value_template": template,
-                "device": device_info,
-                "availability": [{"topic": self._topics.availability}],
-                "entity_category": "diagnostic",
+                **extra,
             }
-            if extra:
-                payload.update(extra)
             entities.append(("sensor", object_id, payload))
 
         sensor(
@@ -271,15 +476,42 @@ class MQTTBridge:
                     "max": 100,
                     "step": 1,
                     "device": device_info,
-                    "availability": [{"topic": self._topics.availability}],
+                    "availability": availability,
                 },
             )
         )
+        pending: list[tuple[str, bytes]] = []
         for component, object_id, payload in entities:
             unique = f"{self.config.identity.instance_name}_{object_id}"
             payload["unique_id"] = unique
             topic = f"{self._topics.discovery_prefix}/{component}/{unique}/config"
-            self._client.publish(topic, json.dumps(payload), retain=True, qos=1)
+            pending.append((topic, orjson.dumps(payload)))
+        return pending
+
+    def _tune_socket(self, sock: socket.socket) -> None:
+        """Send small MQTT frames immediately and notice dead peers without waiting on paho."""
+        if not isinstance(sock, socket.socket):  # websocket transport wraps the socket
+            return
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_USER_TIMEOUT"):
+            # Drop the connection once written data goes unacknowledged for a keepalive period.
+            timeout_ms = self.config.mqtt.keepalive * 1000
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, timeout_ms)
+
+    @contextmanager
+    def _corked(self) -> Iterator[None]:
+        """Hold back partial TCP segments (Linux ``TCP_CORK``) until the block exits."""
+        sock = self._client.socket()
+        if sock is None or not hasattr(socket, "TCP_CORK"):
+            yield
+            return
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1)
+        try:
+            yield
+        finally:
+            with suppress(OSError):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 0)
 
     def _device_payload(self) -> dict[str, Any]:
         return {
@@ -289,5 +521,5 @@ class MQTTBridge:
             "model": "Bluetooth Snapcast Bridge",
         }
 
-    async def _publish_availability(self, state: str) -> None:
+    async def _publish_availability(self, state: bytes) -> None:
         self._client.publish(self._topics.availability, state, retain=True, qos=1)
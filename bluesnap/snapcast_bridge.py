@@ -8,9 +8,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import shutil
+import time
+from collections.abc import Coroutine
 from contextlib import suppress
 from dataclasses import dataclass
-from datetime import datetime
+from typing import Any
 
 from snapcast.control.client import Snapclient
 from snapcast.control.server import Snapserver
@@ -19,6 +21,10 @@ from .config import IdentityConfig, SnapcastConfig
 
 LOG = logging.getLogger(__name__)
 
+# Bounds for the delay between Snapserver control connect attempts (seconds).
+CONTROL_RETRY_MIN_DELAY = 1
+CONTROL_RETRY_MAX_DELAY = 60
+
 
 class SnapclientNotFoundError(FileNotFoundError):
     """Raised when the snapclient binary is missing."""
@@ -27,8 +33,9 @@ class SnapclientNotFoundError(FileNotFoundError):
 @dataclass(slots=True)
 class SnapcastStatus:
     connected: bool = False
-    last_start: datetime | None = None
-    last_exit: datetime | None = None
+    # time.monotonic() readings; only meaningful relative to each other.
+    last_start: float | None = None
+    last_exit: float | None = None
     restart_count: int = 0
     last_returncode: int | None = None
 
@@ -49,17 +56,19 @@ class SnapcastManager:
     ) -> None:
         self._config = config
         self._identity = identity
-        self._loop = loop or asyncio.get_event_loop()
+        self._loop = loop
         self._process: asyncio.subprocess.Process | None = None
-        self._monitor_task: asyncio.Task[None] | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
         self._running = False
         self._status = SnapcastStatus()
         self._snapclient_path = shutil.which("snapclient")
         if not self._snapclient_path:
             raise SnapclientNotFoundError("snapclient binary not found in PATH")
         self._control: Snapserver | None = None
-        self._control_client_id: str | None = None
+        self._client: Snapclient | None = None
         self._control_lock = asyncio.Lock()
+        self._control_retry_delay = CONTROL_RETRY_MIN_DELAY
+        self._next_retry_at = float("-inf")
 
     @property
     def status(self) -> SnapcastStatus:
@@ -69,17 +78,17 @@ class SnapcastManager:
         if self._running:
             return
         self._running = True
+        self._loop = self._loop or asyncio.get_running_loop()
         await self._ensure_process()
         await self._ensure_control_client()
-        self._monitor_task = self._loop.create_task(self._monitor_loop(), name="snapclient-monitor")
+        self._spawn(self._monitor_loop(), "snapclient-monitor")
 
     async def stop(self) -> None:
         self._running = False
-        if self._monitor_task:
-            self._monitor_task.cancel()
+        for task in list(self._tasks):
+            task.cancel()
             with suppress(asyncio.CancelledError):
-                await self._monitor_task
-            self._monitor_task = None
+                await task
         if self._process and self._process.returncode is None:
             LOG.info("terminating snapclient (pid %s)", self._process.pid)
             self._process.terminate()
@@ -89,7 +98,9 @@ class SnapcastManager:
         if self._control:
             self._control.stop()
             self._control = None
-        self._control_client_id = None
+        self._client = None
+        self._control_retry_delay = CONTROL_RETRY_MIN_DELAY
+        self._next_retry_at = float("-inf")
 
     async def set_volume(self, value: int) -> None:
         """
@@ -100,25 +111,22 @@ class SnapcastManager:
         if not await self._ensure_control_client():
             LOG.warning("snapserver control unavailable; cannot set volume")
             return
-        assert self._control_client_id
+        assert self._client
         volume = {"percent": value, "muted": False}
         try:
-            await self._control.client_volume(self._control_client_id, volume)
+            await self._control.client_volume(self._client.identifier, volume)
             LOG.info("set snapclient volume to %s", value)
         except (OSError, RuntimeError) as exc:
             LOG.error("failed to set snapclient volume via RPC: %s", exc)
 
     async def mute(self, state: bool) -> None:
-        if not await self._ensure_control_client():
-            LOG.warning("snapserver control unavailable; cannot toggle mute")
-            return
         client = await self._control_client()
         if not client:
             LOG.warning("snapserver control unavailable; cannot toggle mute")
             return
         volume = {"percent": client.volume, "muted": state}
         try:
-            await self._control.client_volume(self._control_client_id, volume)
+            await self._control.client_volume(client.identifier, volume)
             LOG.info("set snapclient mute=%s", state)
         except (OSError, RuntimeError) as exc:
             LOG.error("failed to set snapclient mute via RPC: %s", exc)
@@ -130,12 +138,12 @@ class SnapcastManager:
                 continue
             returncode = await self._process.wait()
             self._status.connected = False
-            self._status.last_exit = datetime.utcnow()
+            self._status.last_exit = time.monotonic()
             self._status.last_returncode = returncode
             LOG.warning("snapclient exited with code %s", returncode)
             if not self._running:
                 break
-            self._control_client_id = None
+            self._client = None
             await asyncio.sleep(5)
             await self._ensure_process()
             await self._ensure_control_client()
@@ -148,12 +156,27 @@ class SnapcastManager:
         self._process = await asyncio.create_subprocess_exec(
             *command,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
         )
+        self._spawn(self._drain_output(self._process), "snapclient-output")
         self._status.connected = True
-        self._status.last_start = datetime.utcnow()
+        self._status.last_start = time.monotonic()
         self._status.restart_count += 1
 
+    @staticmethod
+    async def _drain_output(process: asyncio.subprocess.Process) -> None:
+        """Forward snapclient output to the log so a full pipe never blocks it."""
+        assert process.stdout
+        while line := await process.stdout.readline():
+            LOG.debug("snapclient: %s", line.decode("utf-8", "replace").rstrip())
+
+    def _spawn(self, coro: Coroutine[Any, Any, None], name: str) -> None:
+        task = self._loop.create_task(coro, name=name)
+        # The loop only keeps weak references; an output drain from a previous
+        # snapclient can still be finishing when its replacement is spawned.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
     def _build_command(self) -> list[str]:
         config = self._config
         soundcard = config.audio_device or self._default_soundcard(config.audio_backend)
@@ -182,34 +205,54 @@ class SnapcastManager:
         return backend
 
     async def _ensure_control_client(self) -> bool:
+        if self._control is not None and self._client is not None:
+            # synchronize() rebuilds the client map without clients the server deleted,
+            # so a cached object that is no longer the one on record must be re-resolved.
+            try:
+                current = self._control.client(self._client.identifier)
+            except KeyError:
+                current = None
+            if current is self._client:
+                return True
+            LOG.info("snapclient %s no longer known to snapserver", self._client.identifier)
+            self._client = None
         async with self._control_lock:
             if self._control is None:
+                if self._loop.time() < self._next_retry_at:
+                    return False
+                # Once connected, Snapserver re-establishes a dropped socket on its own,
+                # so the instance is kept until stop() rather than rebuilt per failure.
+                control = Snapserver(
+                    self._loop,
+                    self._config.server_host,
+                    port=self._config.control_port,
+                    reconnect=True,
+                )
+                control.set_on_connect_callback(self._on_control_connect)
+                control.set_on_disconnect_callback(self._on_control_disconnect)
                 try:
-                    self._control = Snapserver(
-                        self._loop,
-                        self._config.server_host,
-                        port=self._config.control_port,
-                    )
-                    await self._control.start()
-                    LOG.info(
-                        "connected to snapserver control at %s:%s",
-                        self._config.server_host,
-                        self._config.control_port,
-                    )
+                    await control.start()
                 except OSError as exc:
-                    LOG.error("failed to connect to snapserver control: %s", exc)
-                    self._control = None
+                    delay = self._control_retry_delay
+                    self._next_retry_at = self._loop.time() + delay
+                    self._control_retry_delay = min(delay * 2, CONTROL_RETRY_MAX_DELAY)
+                    LOG.error(
+                        "failed to connect to snapserver control, retrying in %ss: %s",
+                        delay,
+                        exc,
+                    )
                     return False
-            if not self._control_client_id:
+                self._control = control
+            if self._client is None:
                 resolved_name = self._config.resolved_client_name(self._identity)
                 for client in self._control.clients:
                     if client.friendly_name == resolved_name or client.identifier == resolved_name:
-                        self._control_client_id = client.identifier
+                        self._client = client
                         LOG.info(
                             "resolved snapclient id %s for '%s'", client.identifier, resolved_name
                         )
                         break
-                if not self._control_client_id:
+                if self._client is None:
                     LOG.warning(
                         "snapclient named '%s' not found on control interface; available: %s",
                         resolved_name,
@@ -218,14 +261,21 @@ class SnapcastManager:
                     return False
             return True
 
+    def _on_control_connect(self) -> None:
+        self._control_retry_delay = CONTROL_RETRY_MIN_DELAY
+        LOG.info(
+            "connected to snapserver control at %s:%s",
+            self._config.server_host,
+            self._config.control_port,
+        )
+
+    def _on_control_disconnect(self, exc: Exception | None) -> None:
+        LOG.warning("snapserver control connection lost, reconnecting: %s", exc)
+
     async def _control_client(self) -> Snapclient | None:
         if not await self._ensure_control_client():
             return None
-        try:
-            return self._control.client(self._control_client_id)  # type: ignore[arg-type]
-        except (KeyError, AttributeError):
-            self._control_client_id = None
-            return None
+        return self._client
 
     async def current_volume(self) -> int | None:
         client = await self._control_client()
@@ -8,7 +8,7 @@ import asyncio
 import logging
 import os
 from contextlib import suppress
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 import psutil
@@ -22,6 +22,9 @@ if TYPE_CHECKING:  # pragma: no cover
 
 LOG = logging.getLogger(__name__)
 
+THERMAL_ZONE_PATH = "/sys/class/thermal/thermal_zone0/temp"
+LOAD_KEYS = ("load_1m", "load_5m", "load_15m")
+
 
 class TelemetryPublisher:
     """Background task that periodically publishes telemetry payloads."""
@@ -39,15 +42,28 @@ class TelemetryPublisher:
         self._bluetooth = bluetooth
         self._snapcast = snapcast
         self._mqtt = mqtt
-        self._loop = loop or asyncio.get_event_loop()
+        self._loop = loop
         self._task: asyncio.Task[None] | None = None
         self._interval = max(5, config.telemetry.interval)
+        self._metrics = frozenset(config.telemetry.metrics)
+        # Reused every tick: MQTTBridge.publish_telemetry serializes before returning.
+        self._payload: dict[str, Any] = {
+            "timestamp": None,
+            "identity": {
+                "instance_name": config.identity.instance_name,
+                "friendly_name": config.identity.friendly_name,
+            },
+            "snapcast": {},
+        }
+        if "bluetooth" in self._metrics:
+            self._payload["bluetooth"] = {}
         self._running = False
 
     def start(self) -> None:
         if self._running:
             return
         self._running = True
+        self._loop = self._loop or asyncio.get_running_loop()
         self._task = self._loop.create_task(self._run(), name="telemetry-loop")
 
     async def stop(self) -> None:
@@ -72,30 +88,25 @@ class TelemetryPublisher:
             await asyncio.sleep(self._interval)
 
     async def _build_payload(self) -> dict[str, Any]:
-        metrics = set(self._config.telemetry.metrics)
-        payload: dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "identity": {
-                "instance_name": self._config.identity.instance_name,
-                "friendly_name": self._config.identity.friendly_name,
-            },
-            "snapcast": {
-                "connected": self._snapcast.status.connected,
-                "restart_count": self._snapcast.status.restart_count,
-            },
-        }
+        metrics = self._metrics
+        payload = self._payload
+        payload["timestamp"] = datetime.now(UTC)  # orjson emits ISO 8601 natively
 
+        snapcast = payload["snapcast"]
+        snapcast["connected"] = self._snapcast.status.connected
+        snapcast["restart_count"] = self._snapcast.status.restart_count
         volume = await self._snapcast.current_volume()
         if volume is not None:
-            payload["snapcast"]["volume"] = volume
+            snapcast["volume"] = volume
+        else:
+            snapcast.pop("volume", None)
 
         if "bluetooth" in metrics:
             speaker = self._bluetooth.active_speaker
-            payload["bluetooth"] = {
-                "connected": self._bluetooth.connected,
-                "speaker": speaker.name,
-                "mac": speaker.mac,
-            }
+            bluetooth = payload["bluetooth"]
+            bluetooth["connected"] = self._bluetooth.connected
+            bluetooth["speaker"] = speaker.name
+            bluetooth["mac"] = speaker.mac
 
         if "cpu" in metrics:
             payload["cpu_percent"] = psutil.cpu_percent(interval=None)
@@ -105,22 +116,29 @@ class TelemetryPublisher:
 
         if "load" in metrics:
             try:
-                load_1m, load_5m, load_15m = os.getloadavg()
-                payload["load_1m"] = load_1m
-                payload["load_5m"] = load_5m
-                payload["load_15m"] = load_15m
+                payload.update(zip(LOAD_KEYS, os.getloadavg(), strict=True))
             except OSError:
-                pass
+                for key in LOAD_KEYS:
+                    payload.pop(key, None)
 
         if "temperature" in metrics:
             temperature = self._read_temperature()
             if temperature is not None:
                 payload["temperature_c"] = temperature
+            else:
+                payload.pop("temperature_c", None)
 
         return payload
 
     @staticmethod
     def _read_temperature() -> float | None:
+        # The sysfs thermal zone is a single small read; psutil walks every
+        # hwmon/thermal entry to build its table, so only fall back to it.
+        try:
+            with open(THERMAL_ZONE_PATH, "rb") as handle:
+                return int(handle.read()) / 1000.0
+        except (OSError, ValueError):
+            pass
         try:
             temps = psutil.sensors_temperatures()
         except (RuntimeError, AttributeError, PermissionError):
@@ -4,29 +4,39 @@ Miscellaneous helpers shared across modules.
 
 from __future__ import annotations
 
+import re
 import subprocess
 
+_BD_ADDRESS_RE = re.compile(rb"BD Address: ([0-9A-Fa-f:]+)")
+
+# Controller addresses never change while the process is running.
+_CONTROLLER_IDS: dict[str, str] = {}
+
 
 def resolve_controller_identifier(adapter: str) -> str:
     """
     Return the controller address (e.g., E4:5F:...) for a given adapter name (e.g., hci0).
+
+    Forks ``hciconfig`` once per adapter; the result is cached for the process.
     """
 
+    if cached := _CONTROLLER_IDS.get(adapter):
+        return cached
     try:
         result = subprocess.run(
             ["hciconfig", adapter],
             check=True,
             capture_output=True,
-            text=True,
         )
     except subprocess.CalledProcessError as exc:
-        stderr = exc.stderr.strip() if exc.stderr else "unknown error"
+        stderr = exc.stderr.decode("utf-8", "replace").strip() if exc.stderr else "unknown error"
         raise RuntimeError(f"Failed to query adapter '{adapter}': {stderr}") from exc
 
-    for line in result.stdout.splitlines():
-        if "BD Address" in line:
-            return line.split("BD Address:")[1].split()[0].strip()
-    raise RuntimeError(f"Unable to determine controller identifier for adapter '{adapter}'")
+    if not (match := _BD_ADDRESS_RE.search(result.stdout)):
+        raise RuntimeError(f"Unable to determine controller identifier for adapter '{adapter}'")
+    address = match.group(1).decode("ascii").upper()
+    _CONTROLLER_IDS[adapter] = address
+    return address
 
 
 __all__ = ["resolve_controller_identifier"]
@@ -10,6 +10,8 @@ import argparse
 import asyncio
 import logging
 import signal
+import sys
+from collections.abc import Callable
 from pathlib import Path
 
 from bluesnap.bluetooth_controller import BluetoothController
@@ -69,9 +71,21 @@ async def run_service(config_path: Path) -> None:
     await bluetooth.stop()
 
 
+def event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's (libuv-based) loop constructor when installed, else the stdlib default."""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def main() -> int:
     args = parse_args()
-    return asyncio.run(run_service(Path(args.config)))
+    with asyncio.Runner(loop_factory=event_loop_factory()) as runner:
+        return runner.run(run_service(Path(args.config)))
 
 
 if __name__ == "__main__":
@@ -17,15 +17,35 @@ import grp
 import logging
 import os
 import pwd
+import shlex
 import shutil
 import subprocess
 import tempfile
+import time
 from pathlib import Path
+from string import Template
 
 APT_PACKAGES = ["bluez", "snapclient", "python3-venv", "curl"]
 BLUETOOTH_GROUP = "bluetooth"
 SERVICE_NAME = "bluesnap.service"
 UV_INSTALL_SCRIPT = "https://astral.sh/uv/install.sh"
+# Touched by apt after every successful update (apt.conf.d/15update-stamp).
+APT_UPDATE_STAMP = Path("/var/lib/apt/periodic/update-success-stamp")
+APT_UPDATE_MAX_AGE = 24 * 60 * 60
+HEREDOC_END = "BLUESNAP_EOF"
+
+
+class UnitTemplate(Template):
+    """``string.Template`` that fills the ``{{NAME}}`` placeholders used in systemd/."""
+
+    pattern = r"""
+    \{\{(?:
+        (?P<escaped>(?!))
+      | (?P<named>[A-Z_]+)\}\}
+      | (?P<braced>(?!))
+      | (?P<invalid>)
+    )
+    """
 
 
 def parse_args() -> argparse.Namespace:
@@ -45,6 +65,16 @@ def parse_args() -> argparse.Namespace:
         default=".venv",
         help="Virtualenv directory (default: .venv)",
     )
+    parser.add_argument(
+        "--force-apt-update",
+        action="store_true",
+        help="Run apt-get update even if the package lists were refreshed in the last day",
+    )
+    parser.add_argument(
+        "--rebuild-venv",
+        action="store_true",
+        help="Recreate the virtualenv from scratch instead of updating it in place",
+    )
     return parser.parse_args()
 
 
@@ -53,10 +83,75 @@ def run(cmd: list[str], *, check: bool = True, env: dict[str, str] | None = None
     subprocess.run(cmd, check=check, env=env)
 
 
-def ensure_apt_packages() -> None:
+def sudo_step(cmd: list[str], *, check: bool = True) -> str:
+    """Render a command as one line of a privileged batch script."""
+    line = shlex.join(cmd)
+    return line if check else f"{line} || true"
+
+
+def install_file_step(content: str, target: Path, mode: str = "0644") -> str:
+    """Render a batch step that writes ``content`` to ``target`` (creating parents)."""
+    if not content.endswith("\n"):
+        content += "\n"
+    install = shlex.join(["install", "-D", "-m", mode, "/dev/stdin", str(target)])
+    return f"{install} <<'{HEREDOC_END}'\n{content}{HEREDOC_END}"
+
+
+def run_batch_sudo(steps: list[str]) -> None:
+    """Run the queued privileged steps in a single ``sudo bash`` and clear the queue."""
+    if not steps:
+        return
+    for step in steps:
+        logging.info("queued: %s", step.partition("\n")[0])
+    with tempfile.NamedTemporaryFile("w", suffix=".sh", delete=False) as tmp:
+        tmp.write("set -e\n")
+        tmp.write("\n".join(steps))
+        tmp.write("\n")
+        script = Path(tmp.name)
+    try:
+        run(["sudo", "bash", str(script)])
+    finally:
+        script.unlink(missing_ok=True)
+    steps.clear()
+
+
+def _apt_lists_fresh() -> bool:
+    try:
+        age = time.time() - APT_UPDATE_STAMP.stat().st_mtime
+    except OSError:
+        return False
+    return age < APT_UPDATE_MAX_AGE
+
+
+def _missing_apt_packages() -> list[str]:
+    try:
+        result = subprocess.run(
+            ["dpkg-query", "-W", "-f=${Package} ${Status}\n", *APT_PACKAGES],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
+        return list(APT_PACKAGES)
+    installed = {
+        line.split(" ", 1)[0]
+        for line in result.stdout.splitlines()
+        if line.endswith(" install ok installed")
+    }
+    return [package for package in APT_PACKAGES if package not in installed]
+
+
+def ensure_apt_packages(pending_sudo: list[str], *, force_update: bool = False) -> None:
     logging.info("ensuring apt packages: %s", ", ".join(APT_PACKAGES))
-    run(["sudo", "apt-get", "update"])
-    run(["sudo", "apt-get", "install", "-y", *APT_PACKAGES])
+    missing = _missing_apt_packages()
+    if force_update or (missing and not _apt_lists_fresh()):
+        pending_sudo.append(sudo_step(["apt-get", "update"]))
+    elif missing:
+        logging.info("apt package lists updated within the last day; skipping apt-get update")
+    if not missing:
+        logging.info("apt packages already installed")
+        return
+    pending_sudo.append(sudo_step(["apt-get", "install", "-y", *missing]))
 
 
 def ensure_uv() -> str:
@@ -96,9 +191,14 @@ def ensure_venv_ownership(venv_path: Path) -> None:
     run(["sudo", "chown", "-R", f"{user}:{group}", str(venv_path)])
 
 
-def ensure_virtualenv(uv_path: str, venv_path: Path) -> None:
+def ensure_virtualenv(uv_path: str, venv_path: Path, *, rebuild: bool = False) -> None:
     ensure_venv_ownership(venv_path)
-    run([uv_path, "venv", "--clear", str(venv_path)])
+    if rebuild:
+        run([uv_path, "venv", "--clear", str(venv_path)])
+    elif not (venv_path / "pyvenv.cfg").exists():
+        run([uv_path, "venv", str(venv_path)])
+    else:
+        logging.info("reusing virtualenv at %s", venv_path)
     ensure_venv_ownership(venv_path)
     run([uv_path, "pip", "install", "-e", ".[dev]"])
 
@@ -111,46 +211,46 @@ def ensure_boot_script(repo_root: Path) -> None:
     logging.info("ensured boot script is executable")
 
 
-def ensure_bluetooth_group() -> None:
+def ensure_bluetooth_group(pending_sudo: list[str]) -> None:
     """Ensure the current user belongs to the bluetooth group."""
 
-    user = Path.home().owner()
+    account = pwd.getpwuid(os.getuid())
+    user = account.pw_name
     logging.info("adding %s to %s group (if needed)", user, BLUETOOTH_GROUP)
-    result = subprocess.run(
-        ["groups", user],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    if BLUETOOTH_GROUP in result.stdout.split():
+    try:
+        group = grp.getgrnam(BLUETOOTH_GROUP)
+    except KeyError:
+        member = False
+    else:
+        member = user in group.gr_mem or group.gr_gid == account.pw_gid
+    if member:
         logging.info("%s already in %s group", user, BLUETOOTH_GROUP)
         return
-    run(["sudo", "usermod", "-aG", BLUETOOTH_GROUP, user], check=False)
+    pending_sudo.append(sudo_step(["usermod", "-aG", BLUETOOTH_GROUP, user], check=False))
     logging.warning(
-        "Added %s to %s group. You must log out/in (or reboot) for this to take effect.",
+        "Adding %s to %s group. You must log out/in (or reboot) for this to take effect.",
         user,
         BLUETOOTH_GROUP,
     )
 
 
-def ensure_bluetooth_service() -> None:
+def ensure_bluetooth_service(pending_sudo: list[str]) -> None:
     logging.info("ensuring bluetooth.service is enabled and running")
-    run(["sudo", "systemctl", "enable", "bluetooth.service"])
-    run(["sudo", "systemctl", "restart", "bluetooth.service"])
+    pending_sudo.append(sudo_step(["systemctl", "enable", "bluetooth.service"]))
+    pending_sudo.append(sudo_step(["systemctl", "restart", "bluetooth.service"]))
 
 
-def ensure_rfkill_unblocked() -> None:
+def ensure_rfkill_unblocked(pending_sudo: list[str]) -> None:
     logging.info("unblocking bluetooth via rfkill")
-    run(["sudo", "rfkill", "unblock", "bluetooth"], check=False)
+    pending_sudo.append(sudo_step(["rfkill", "unblock", "bluetooth"], check=False))
 
 
-def ensure_adapter_powered() -> None:
+def ensure_adapter_powered(pending_sudo: list[str]) -> None:
     logging.info("attempting to power on bluetooth adapter")
-    command = "printf 'power on\nquit\n' | bluetoothctl"
-    run(["sudo", "bash", "-lc", command], check=False)
+    pending_sudo.append("printf 'power on\\nquit\\n' | bluetoothctl || true")
 
 
-def ensure_console_autologin(user: str) -> None:
+def ensure_console_autologin(user: str, pending_sudo: list[str]) -> None:
     """Configure tty1 to auto-login the specified user."""
 
     dropin_dir = Path("/etc/systemd/system/getty@tty1.service.d")
@@ -167,41 +267,30 @@ def ensure_console_autologin(user: str) -> None:
         logging.info("console auto-login already configured for %s", user)
         return
 
-    tmp = tempfile.NamedTemporaryFile("w", delete=False)
-    try:
-        tmp.write(desired)
-        tmp.flush()
-        run(["sudo", "install", "-D", "-m", "0644", tmp.name, str(target)])
-    finally:
-        Path(tmp.name).unlink(missing_ok=True)
-    run(["sudo", "systemctl", "daemon-reload"])
-    run(["sudo", "systemctl", "restart", "getty@tty1.service"])
-    logging.info("enabled console auto-login for %s", user)
+    pending_sudo.append(install_file_step(desired, target))
+    pending_sudo.append(sudo_step(["systemctl", "daemon-reload"]))
+    pending_sudo.append(sudo_step(["systemctl", "restart", "getty@tty1.service"]))
+    logging.info("enabling console auto-login for %s", user)
 
 
-def install_systemd_unit(repo_root: Path, config_path: Path) -> None:
+def install_systemd_unit(repo_root: Path, config_path: Path, pending_sudo: list[str]) -> None:
     systemd_dir = repo_root / "systemd"
     template_path = systemd_dir / "bluesnap.service"
     if not template_path.exists():
         raise FileNotFoundError(f"service template missing: {template_path}")
-    template = template_path.read_text()
     user, group = _current_user_group()
-    content = (
-        template.replace("{{REPO_PATH}}", str(repo_root))
-        .replace("{{CONFIG_PATH}}", str(config_path))
-        .replace("{{SERVICE_USER}}", user)
-        .replace("{{SERVICE_GROUP}}", group)
-        .replace("{{SERVICE_UID}}", str(os.getuid()))
+    content = UnitTemplate(template_path.read_text()).substitute(
+        REPO_PATH=repo_root,
+        CONFIG_PATH=config_path,
+        SERVICE_USER=user,
+        SERVICE_GROUP=group,
+        SERVICE_UID=os.getuid(),
     )
-    with tempfile.NamedTemporaryFile("w", delete=False) as tmp:
-        tmp.write(content)
-        temp_path = Path(tmp.name)
-    run(["sudo", "cp", str(temp_path), f"/etc/systemd/system/{SERVICE_NAME}"])
-    temp_path.unlink(missing_ok=True)
-    run(["sudo", "systemctl", "daemon-reload"])
-    run(["sudo", "systemctl", "enable", SERVICE_NAME])
-    run(["sudo", "systemctl", "restart", SERVICE_NAME])
-    logging.info("systemd service installed and restarted")
+    pending_sudo.append(install_file_step(content, Path("/etc/systemd/system") / SERVICE_NAME))
+    pending_sudo.append(sudo_step(["systemctl", "daemon-reload"]))
+    pending_sudo.append(sudo_step(["systemctl", "enable", SERVICE_NAME]))
+    pending_sudo.append(sudo_step(["systemctl", "restart", SERVICE_NAME]))
+    logging.info("installing and restarting systemd service")
 
 
 def main() -> int:
@@ -218,20 +307,25 @@ def main() -> int:
         logging.error("configuration file not found at %s", config_path)
         return 1
 
-    ensure_apt_packages()
+    # Privileged steps are queued and run through one sudo invocation per batch.
+    pending_sudo: list[str] = []
+    ensure_apt_packages(pending_sudo, force_update=args.force_apt_update)
+    # uv's installer needs curl from apt, so the package batch runs first.
+    run_batch_sudo(pending_sudo)
     uv_path = ensure_uv()
-    ensure_virtualenv(uv_path, repo_root / args.venv)
-    ensure_console_autologin(user)
+    ensure_virtualenv(uv_path, repo_root / args.venv, rebuild=args.rebuild_venv)
+    ensure_console_autologin(user, pending_sudo)
     ensure_boot_script(repo_root)
-    ensure_bluetooth_group()
-    ensure_bluetooth_service()
-    ensure_rfkill_unblocked()
-    ensure_adapter_powered()
+    ensure_bluetooth_group(pending_sudo)
+    ensure_bluetooth_service(pending_sudo)
+    ensure_rfkill_unblocked(pending_sudo)
+    ensure_adapter_powered(pending_sudo)
 
     if not args.skip_systemd:
-        install_systemd_unit(repo_root, config_path)
+        install_systemd_unit(repo_root, config_path, pending_sudo)
     else:
         logging.info("skipping systemd installation per flag")
+    run_batch_sudo(pending_sudo)
     logging.info("setup complete")
     return 0
 
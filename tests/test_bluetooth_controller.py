@@ -0,0 +1,134 @@
+"""Tests for the persistent bluetoothctl session used by BluetoothController."""
+
+from __future__ import annotations
+
+import asyncio
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from bluesnap.bluetooth_controller import BluetoothController
+from bluesnap.config import BluetoothConfig
+
+SPEAKER_MAC = "AA:BB:CC:DD:EE:FF"
+
+# Mimics bluetoothctl's line protocol: no ``echo`` builtin, unknown commands are
+# reported by name, and (optionally) every input line is echoed behind a prompt.
+FAKE_BLUETOOTHCTL = """\
+#!{python}
+import sys
+
+ECHO_INPUT = {echo_input!r}
+CONNECTED = {connected!r}
+SILENT = {silent!r}
+
+for line in sys.stdin:
+    cmd = line.strip()
+    if cmd == "quit":
+        break
+    if SILENT:
+        continue
+    if ECHO_INPUT:
+        print(f"[bluetooth]# {{cmd}}")
+    name, _, arg = cmd.partition(" ")
+    if name == "select":
+        print(f"Controller {{arg}} selected")
+    elif name == "info":
+        print(f"Device {{arg}} (public)")
+        print("\\tName: Speaker")
+        print(f"\\tConnected: {{CONNECTED}}")
+        print("\\tUUID: Audio Sink")
+    elif name == "show":
+        print("Controller 00:11:22:33:44:55 (public)")
+        print("\\tPowered: yes")
+    else:
+        print(f"Invalid command in menu main: {{name}}")
+        print('Use "help" for a list of available commands in a menu.')
+    sys.stdout.flush()
+"""
+
+
+def _install_fake(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    echo_input: bool = False,
+    connected: str = "yes",
+    silent: bool = False,
+) -> None:
+    script = tmp_path / "bluetoothctl"
+    script.write_text(
+        FAKE_BLUETOOTHCTL.format(
+            python=sys.executable, echo_input=echo_input, connected=connected, silent=silent
+        )
+    )
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{Path(sys.executable).parent}")
+
+
+def _controller() -> BluetoothController:
+    config = BluetoothConfig.model_validate({"speaker": {"name": "Speaker", "mac": SPEAKER_MAC}})
+    controller = BluetoothController(config)
+    # Normally read from BlueZ in start(); these tests drive bluetoothctl directly.
+    controller._controller_id = "00:11:22:33:44:55"
+    return controller
+
+
+@pytest.mark.parametrize("echo_input", [False, True])
+def test_run_btctl_frames_each_batch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, echo_input: bool
+) -> None:
+    _install_fake(tmp_path, monkeypatch, echo_input=echo_input)
+
+    async def scenario() -> tuple[bytes, bytes]:
+        controller = _controller()
+        try:
+            info = await controller._run_btctl(["info", SPEAKER_MAC], timeout=5)
+            show = await controller._run_btctl(["show"], timeout=5)
+        finally:
+            await controller._close_proc()
+        return info, show
+
+    info, show = asyncio.run(scenario())
+    assert b"Connected: yes" in info
+    assert b"Powered: yes" in show
+    assert b"Connected:" not in show
+
+
+@pytest.mark.parametrize(("state", "expected"), [("yes", True), ("no", False)])
+def test_query_connected_reads_info(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, state: str, expected: bool
+) -> None:
+    _install_fake(tmp_path, monkeypatch, echo_input=True, connected=state)
+
+    async def scenario() -> tuple[bool, bytes]:
+        controller = _controller()
+        controller._loop = asyncio.get_running_loop()
+        try:
+            connected = await controller._query_connected(timeout=5)
+            # The next command waits for the background drain and sees only its own output.
+            show = await controller._run_btctl(["show"], timeout=5)
+        finally:
+            await controller._close_proc()
+        return connected, show
+
+    connected, show = asyncio.run(scenario())
+    assert connected is expected
+    assert b"UUID" not in show
+
+
+def test_run_btctl_discards_unresponsive_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_fake(tmp_path, monkeypatch, silent=True)
+
+    async def scenario() -> BluetoothController:
+        controller = _controller()
+        with pytest.raises(TimeoutError):
+            await controller._run_btctl(["show"], timeout=0.5)
+        return controller
+
+    controller = asyncio.run(scenario())
+    assert controller._proc is None